@@ -5,10 +5,11 @@ sample OHLC data for local end-to-end testing.
 """
 
 import asyncio
-from datetime import datetime, timezone
+import logging
 from typing import AsyncIterator
 
 import grpc
+import numpy as np
 from google.protobuf.timestamp_pb2 import Timestamp
 
 from varon_fi.proto.varon_fi_pb2 import (
@@ -24,6 +25,8 @@ from varon_fi.proto.varon_fi_pb2_grpc import (
     add_DataServiceServicer_to_server,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class MockDataService(DataServiceServicer):
     """Mock DataService that generates sample OHLC data."""
@@ -32,66 +35,106 @@ class MockDataService(DataServiceServicer):
         self.symbols = ['BTC', 'ETH']
         self.timeframe = '5m'
         self.price_seeds = {'BTC': 50000.0, 'ETH': 3000.0}
-        
+        # Reused per emission tick so each symbol in a batch shares one clock read.
+        self._ts = Timestamp()
+        self._counter = 0
+        # Price variations are drawn in bulk from NumPy's RNG and consumed by
+        # index, amortizing the per-call cost of Python-level randomness.
+        self._rng = np.random.default_rng()
+        self._rand_buf = self._rng.uniform(-0.05, 0.05, size=4096)
+        self._rand_idx = 0
+
+    def _next_variation(self) -> float:
+        if self._rand_idx >= self._rand_buf.size:
+            self._rand_buf = self._rng.uniform(-0.05, 0.05, size=4096)
+            self._rand_idx = 0
+        value = self._rand_buf[self._rand_idx]
+        self._rand_idx += 1
+        return value
+
     async def StreamOHLC(self, request: DataSubscription, context):
         """Stream OHLC candles."""
         symbols = request.symbols if request.symbols else self.symbols
         timeframe = request.timeframe if request.timeframe else self.timeframe
-        
-        while True:
-            for symbol in symbols:
-                # Generate sample OHLC with small random variation
-                base_price = self.price_seeds[symbol]
-                variation = (hash(datetime.now().isoformat()) % 100 - 50) / 1000
-                price = base_price * (1 + variation)
-                
-                now = datetime.now(timezone.utc)
-                timestamp = Timestamp()
-                timestamp.FromDatetime(now)
-                
-                trace = TraceContext(
-                    timestamp=timestamp,
-                    source_service="mock-dataservice",
-                )
-                
-                yield OHLC(
+
+        # Seed one message per symbol and mutate only the numeric fields per
+        # tick; gRPC serializes at yield, so in-place reuse is safe. Kept
+        # per-stream so concurrent subscriptions never share mutable messages.
+        # The plan tuples make the per-tick loop pure numeric work with no
+        # dict lookups.
+        plan = [
+            (
+                symbol,
+                self.price_seeds[symbol],
+                OHLC(
                     symbol=symbol,
                     timeframe=timeframe,
-                    timestamp=timestamp,
-                    open=price * 0.998,
-                    high=price * 1.002,
-                    low=price * 0.997,
-                    close=price,
                     volume=100.0,
                     count=50,
-                    trace=trace,
-                )
-            
+                    trace=TraceContext(source_service="mock-dataservice", latency_ms=0),
+                ),
+            )
+            for symbol in symbols
+        ]
+
+        while True:
+            # One timestamp per tick, shared across all symbols in the batch.
+            self._ts.GetCurrentTime()
+            timestamp = self._ts
+            self._counter += 1
+            # One format per tick; per-symbol ids are a single concat below.
+            corr_prefix = f"mock-{self._counter}-"
+
+            # All symbols for a tick are yielded back-to-back with no await in
+            # between, letting grpc.aio coalesce the batch into one TCP write.
+            for symbol, base_price, msg in plan:
+                # Generate sample OHLC with small random variation
+                price = base_price * (1 + self._next_variation())
+
+                # Mutate the embedded submessages in place; no temp protos.
+                msg.timestamp.CopyFrom(timestamp)
+                msg.trace.timestamp.CopyFrom(timestamp)
+                msg.trace.correlation_id = corr_prefix + symbol
+                msg.open = price * 0.998
+                msg.high = price * 1.002
+                msg.low = price * 0.997
+                msg.close = price
+                yield msg
+
             # Emit every 5 seconds
             await asyncio.sleep(5)
     
     async def StreamTrades(self, request: DataSubscription, context):
         """Stream raw trades."""
-        while True:
-            await asyncio.sleep(1)
-    
+        # Park until gRPC cancels the RPC; no periodic wakeups.
+        await asyncio.get_running_loop().create_future()
+
     async def StreamOrderBook(self, request: DataSubscription, context):
         """Stream order book snapshots."""
-        while True:
-            await asyncio.sleep(1)
+        await asyncio.get_running_loop().create_future()
 
 
 async def serve(port: int = 50051):
     """Start the mock DataService server."""
-    server = grpc.aio.server()
+    server = grpc.aio.server(
+        options=[
+            ("grpc.http2.max_pings_without_data", 0),
+            ("grpc.http2.min_time_between_pings_ms", 10000),
+            ("grpc.max_concurrent_streams", 128),
+            ("grpc.http2.write_buffer_size", 64 * 1024),
+            ("grpc.max_send_message_length", 4 * 1024 * 1024),
+        ],
+        maximum_concurrent_rpcs=256,
+    )
     add_DataServiceServicer_to_server(MockDataService(), server)
     server.add_insecure_port(f'[::]:{port}')
     await server.start()
-    print(f"Mock DataService running on port {port}")
+    logger.info("Mock DataService running on port %s", port)
     await server.wait_for_termination()
 
 
 if __name__ == "__main__":
     import sys
+    logging.basicConfig(level=logging.INFO)
     port = int(sys.argv[1]) if len(sys.argv) > 1 else 50051
     asyncio.run(serve(port))
@@ -2,7 +2,10 @@
 
 import asyncio
 import os
+import signal
+import sys
 
+import grpc
 from dotenv import load_dotenv
 
 from signal_service.config.settings import Settings
@@ -13,6 +16,41 @@ from signal_service.strategy.engine import StrategyEngine
 load_dotenv()
 
 
+async def _stream_and_process(engine: StrategyEngine, server: SignalServiceServer, data_client: DataServiceClient):
+    """Consume the OHLC stream and emit generated signals.
+
+    A bounded queue decouples the gRPC receive loop from strategy
+    evaluation, so receiving the next candle overlaps engine compute and a
+    full queue pushes back on the stream via HTTP/2 flow control. A single
+    consumer preserves per-symbol candle ordering, which the engine's
+    dedupe and position state rely on.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+
+    async def producer():
+        async for ohlc in data_client.stream_ohlc():
+            await queue.put(ohlc)
+
+    async def consumer():
+        while True:
+            ohlc = await queue.get()
+            signals = await engine.process_candle_signals(ohlc)
+            for signal in signals:
+                await server.emit_signal(signal)
+            if signals:
+                # One write + flush per candle instead of one print per
+                # signal, keeping stdout I/O on the event loop to a minimum.
+                sys.stdout.write(
+                    "".join(
+                        f"[Signal Service] Generated signal: {s.symbol} {s.side}\n"
+                        for s in signals
+                    )
+                )
+                sys.stdout.flush()
+
+    await asyncio.gather(producer(), consumer())
+
+
 async def main():
     """Run the Signal Service for local E2E testing."""
     settings = Settings(
@@ -20,36 +58,58 @@ async def main():
         dataservice_addr=os.getenv("DATASERVICE_GRPC_ADDR", "localhost:50051"),
         signalservice_port=int(os.getenv("SIGNALSERVICE_GRPC_PORT", "50052")),
     )
-    
+
     # Initialize strategy engine
     engine = StrategyEngine(settings.database_url)
     await engine.initialize()
-    
+
+    # One long-lived channel with keepalive so idle middleboxes do not drop
+    # the stream; shared by any client talking to the same address.
+    data_channel = grpc.aio.insecure_channel(
+        settings.dataservice_addr,
+        options=[
+            ("grpc.keepalive_time_ms", 30_000),
+            ("grpc.keepalive_timeout_ms", 10_000),
+            ("grpc.http2.max_pings_without_data", 0),
+            ("grpc.keepalive_permit_without_calls", 1),
+        ],
+    )
+
     # Connect to DataService
     data_client = DataServiceClient(settings.dataservice_addr)
-    await data_client.connect()
-    
+    await data_client.connect(channel=data_channel)
+
     # Start SignalService gRPC server
     server = SignalServiceServer(engine, port=settings.signalservice_port)
     await server.start()
-    
+
     print(f"Signal Service running on port {settings.signalservice_port}")
     print(f"Connected to DataService at {settings.dataservice_addr}")
-    
+
+    # Shut down on SIGINT/SIGTERM via an explicit stop event rather than
+    # relying on KeyboardInterrupt propagation through the event loop.
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    stream_task = asyncio.create_task(_stream_and_process(engine, server, data_client))
     try:
-        # Subscribe to OHLC stream and process
-        async for ohlc in data_client.stream_ohlc():
-            signals = await engine.process_candle_signals(ohlc)
-            for signal in signals:
-                await server.emit_signal(signal)
-                print(f"[Signal Service] Generated signal: {signal.symbol} {signal.side}")
-    except asyncio.CancelledError:
-        pass
+        await stop_event.wait()
     finally:
+        stream_task.cancel()
+        await asyncio.gather(stream_task, return_exceptions=True)
         await server.stop()
         await data_client.disconnect()
+        await data_channel.close()
         await engine.shutdown()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
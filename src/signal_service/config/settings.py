@@ -1,6 +1,6 @@
 """Configuration settings."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
@@ -11,12 +11,13 @@ class Settings:
     dataservice_addr: str
     signalservice_port: int
 
-    # OHLC subscription defaults
-    default_symbols: list[str] = None
-    default_timeframes: list[str] = None
-    
-    def __post_init__(self):
-        if self.default_symbols is None:
-            object.__setattr__(self, 'default_symbols', ['BTC', 'ETH', 'SOL', 'XRP', 'HYPER'])
-        if self.default_timeframes is None:
-            object.__setattr__(self, 'default_timeframes', ['5m'])
+    # OHLC subscription defaults (immutable so instances can share them)
+    default_symbols: tuple[str, ...] = field(
+        default_factory=lambda: ("BTC", "ETH", "SOL", "XRP", "HYPER")
+    )
+    default_timeframes: tuple[str, ...] = field(default_factory=lambda: ("5m",))
+
+    # Warm the Postgres buffer cache for ohlcs at startup (needs pg_prewarm
+    # or falls back to a recent-range scan); off by default since it
+    # competes for shared_buffers.
+    prewarm_ohlcs: bool = False
@@ -1,20 +1,57 @@
 """gRPC client for DataService."""
 
-from typing import AsyncIterator
-import sys
+from typing import AsyncIterator, Optional
 
 import grpc
 from structlog import get_logger
 
-# Ensure compatibility with older generated gRPC modules
-from varon_fi.proto import varon_fi_pb2 as _varon_fi_pb2
-sys.modules.setdefault("varon_fi_pb2", _varon_fi_pb2)
-
 from varon_fi.proto.varon_fi_pb2 import DataSubscription
 from varon_fi.proto.varon_fi_pb2_grpc import DataServiceStub
 
 logger = get_logger(__name__)
 
+# Keepalive pings keep long-lived streams alive across idle periods and the
+# enlarged windows raise streaming throughput; shared by client and server.
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10_000),
+    ("grpc.max_receive_message_length", 16 * 1024 * 1024),
+    ("grpc.http2.initial_window_size", 4 * 1024 * 1024),
+]
+
+
+class OHLCView:
+    """Dict-shaped, lazy view over an OHLC protobuf message.
+
+    Field values are read off the protobuf only when accessed, so the
+    streaming path no longer materializes a full dict per candle.
+    """
+
+    __slots__ = ("_pb",)
+
+    _FIELDS = frozenset(
+        {"symbol", "timeframe", "timestamp", "open", "high", "low", "close", "volume", "count"}
+    )
+
+    def __init__(self, pb):
+        self._pb = pb
+
+    def get(self, key, default=None):
+        if key in self._FIELDS:
+            return getattr(self._pb, key)
+        return default
+
+    def __getitem__(self, key):
+        if key in self._FIELDS:
+            return getattr(self._pb, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._FIELDS
+
 
 class DataServiceClient:
     """Client for consuming DataService gRPC streams."""
@@ -25,14 +62,23 @@ class DataServiceClient:
         self.timeframe = timeframe
         self.channel = None
         self.stub = None
-        
-    async def connect(self):
-        """Connect to DataService."""
-        self.channel = grpc.aio.insecure_channel(self.addr)
+        self._owns_channel = True
+
+    async def connect(self, channel: Optional[grpc.aio.Channel] = None):
+        """Connect to DataService.
+
+        An externally managed channel may be supplied so multiple clients
+        against the same host share one HTTP/2 connection; the caller then
+        owns its lifecycle and ``disconnect`` leaves it open.
+        """
+        self._owns_channel = channel is None
+        self.channel = channel or grpc.aio.insecure_channel(
+            self.addr, options=GRPC_CHANNEL_OPTIONS
+        )
         self.stub = DataServiceStub(self.channel)
         logger.info("Connected to DataService", addr=self.addr)
         
-    async def stream_ohlc(self) -> AsyncIterator[dict]:
+    async def stream_ohlc(self) -> AsyncIterator[OHLCView]:
         """Stream OHLC candles from DataService."""
         request = DataSubscription(
             symbols=self.symbols,
@@ -40,22 +86,12 @@ class DataServiceClient:
             include_trades=False,
             include_orderbook=False,
         )
-        
+
         async for ohlc in self.stub.StreamOHLC(request):
-            yield {
-                'symbol': ohlc.symbol,
-                'timeframe': ohlc.timeframe,
-                'timestamp': ohlc.timestamp,
-                'open': ohlc.open,
-                'high': ohlc.high,
-                'low': ohlc.low,
-                'close': ohlc.close,
-                'volume': ohlc.volume,
-                'count': ohlc.count,
-            }
-        
+            yield OHLCView(ohlc)
+
     async def disconnect(self):
         """Close connection."""
-        if self.channel:
+        if self.channel and self._owns_channel:
             await self.channel.close()
         logger.info("Disconnected from DataService")
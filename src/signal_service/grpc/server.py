@@ -12,53 +12,87 @@ from varon_fi.proto.varon_fi_pb2_grpc import (
     SignalServiceServicer,
     add_SignalServiceServicer_to_server,
 )
+from signal_service.grpc.client import GRPC_CHANNEL_OPTIONS
 from signal_service.strategy.engine import StrategyEngine
 
 logger = get_logger(__name__)
 
+# Sentinel queued on RPC completion so a parked StreamSignals wakes up
+# without polling timers.
+_STREAM_CLOSED = object()
+
+
+def _compile_filter(request: SignalSubscription):
+    """Compile a subscription's strategy/symbol filter to one closure.
+
+    The None-checks and frozenset construction happen once at subscribe
+    time, leaving O(1) set membership per signal in _broadcast.
+    """
+    strat_set = frozenset(request.strategy_ids) if request.strategy_ids else None
+    sym_set = frozenset(request.symbols) if request.symbols else None
+    if strat_set is None and sym_set is None:
+        return None
+    if sym_set is None:
+        return lambda sig: sig.strategy_id in strat_set
+    if strat_set is None:
+        return lambda sig: sig.symbol in sym_set
+    return lambda sig: sig.strategy_id in strat_set and sig.symbol in sym_set
+
 
 class SignalServiceImpl(SignalServiceServicer):
     """gRPC servicer for SignalService."""
 
     def __init__(self, server: "SignalServiceServer"):
         self.server = server
+        # Constant ack fields are pre-built once; only signal_id varies.
+        self._ack_template = SignalAck(success=True, message="published")
 
     async def PublishSignal(self, request: TradeSignal, context) -> SignalAck:
         """Publish a signal (used by Signal Service to emit)."""
         await self.server._broadcast(request)
-        return SignalAck(success=True, message="published", signal_id=request.signal_id)
+        ack = SignalAck()
+        ack.CopyFrom(self._ack_template)
+        ack.signal_id = request.signal_id
+        return ack
 
     async def StreamSignals(self, request: SignalSubscription, context):
         """Subscribe to signal stream (used by Orders Service)."""
         queue: asyncio.Queue = asyncio.Queue()
         sub = (queue, request)
         self.server._subscribers.append(sub)
+        self.server._refresh_subscriber_snapshot()
         logger.info("New signal subscriber", strategies=request.strategy_ids, symbols=request.symbols)
 
-        try:
-            while True:
-                try:
-                    signal: TradeSignal = await asyncio.wait_for(queue.get(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    # Check if context is still valid (client disconnected if cancelled)
-                    if hasattr(context, 'cancelled') and context.cancelled():
-                        break
-                    if hasattr(context, 'is_active') and not context.is_active():
-                        break
-                    continue
-
-                # Filter by strategy/symbol if provided
-                if request.strategy_ids and signal.strategy_id not in request.strategy_ids:
-                    continue
-                if request.symbols and signal.symbol not in request.symbols:
-                    continue
+        # Wake the parked get() on disconnect via gRPC's done callback
+        # instead of scheduling a poll timer per subscriber every second.
+        if hasattr(context, 'add_done_callback'):
+            context.add_done_callback(lambda _: queue.put_nowait(_STREAM_CLOSED))
 
+        try:
+            closed = False
+            while not closed:
+                signal = await queue.get()
+                if signal is _STREAM_CLOSED:
+                    break
                 yield signal
+                # Greedily drain anything that arrived while yielding; the
+                # back-to-back yields let grpc.aio coalesce the burst into
+                # fewer writes. At low load the queue is empty and this is
+                # a no-op, so idle latency is unaffected.
+                while not queue.empty():
+                    signal = queue.get_nowait()
+                    if signal is _STREAM_CLOSED:
+                        closed = True
+                        break
+                    yield signal
         except asyncio.CancelledError:
             logger.info("Signal stream cancelled by client")
         finally:
-            if sub in self.server._subscribers:
+            try:
                 self.server._subscribers.remove(sub)
+            except ValueError:
+                pass
+            self.server._refresh_subscriber_snapshot()
             logger.info("Signal subscriber disconnected")
 
 
@@ -70,11 +104,30 @@ class SignalServiceServer:
         self.port = port
         self.server = None
         self._subscribers: list[tuple[asyncio.Queue, SignalSubscription]] = []
+        # Immutable snapshot iterated by _broadcast; rebuilt only when the
+        # subscriber list changes instead of copying the list per signal.
+        # Each entry pairs the queue with its precompiled filter predicate.
+        self._subscribers_snapshot: tuple = ()
         self._impl = SignalServiceImpl(self)
 
+    def _refresh_subscriber_snapshot(self):
+        """Rebuild the broadcast snapshot after subscribe/unsubscribe."""
+        self._subscribers_snapshot = tuple(
+            (queue, _compile_filter(request)) for queue, request in self._subscribers
+        )
+
     async def start(self):
         """Start the gRPC server."""
-        self.server = grpc.aio.server()
+        self.server = grpc.aio.server(
+            options=GRPC_CHANNEL_OPTIONS
+            + [
+                ("grpc.so_reuseport", 1),
+                ("grpc.max_concurrent_streams", 1024),
+            ],
+            maximum_concurrent_rpcs=1024,
+            # TradeSignal messages are tiny; compression would only add CPU.
+            compression=grpc.Compression.NoCompression,
+        )
         add_SignalServiceServicer_to_server(self._impl, self.server)
         self.server.add_insecure_port(f"[::]:{self.port}")
         await self.server.start()
@@ -87,9 +140,19 @@ class SignalServiceServer:
         logger.info("SignalService stopped")
 
     async def _broadcast(self, trade_signal: TradeSignal):
-        """Broadcast signal to all subscribers."""
-        for queue, _ in list(self._subscribers):
-            await queue.put(trade_signal)
+        """Broadcast signal to all matching subscribers."""
+        subs = self._subscribers_snapshot
+        if len(subs) != len(self._subscribers):
+            # Subscribers appended outside StreamSignals (e.g. in tests).
+            self._refresh_subscriber_snapshot()
+            subs = self._subscribers_snapshot
+        for queue, matches in subs:
+            # Filter here so non-matching subscribers never enqueue at all.
+            if matches is not None and not matches(trade_signal):
+                continue
+            # Queues are unbounded, so put_nowait never raises and the
+            # producer is never blocked behind a slow subscriber.
+            queue.put_nowait(trade_signal)
 
     async def emit_signal(self, signal: Signal):
         """Emit signal to all connected subscribers."""
@@ -18,36 +18,59 @@ load_dotenv()
 
 
 async def stream_for_timeframe(
-    engine: StrategyEngine,
-    server: SignalServiceServer,
+    candle_queue: asyncio.Queue,
     dataservice_addr: str,
     symbols: list[str],
     timeframe: str,
 ):
-    """Stream OHLC for a specific timeframe and process through engine."""
+    """Stream OHLC for a specific timeframe onto the shared candle queue."""
     client = DataServiceClient(dataservice_addr, symbols=symbols, timeframe=timeframe)
     await client.connect()
     try:
         async for ohlc in client.stream_ohlc():
-            signals = await engine.process_candle_signals(ohlc)
-            for signal in signals:
-                await server.emit_signal(signal)
+            await candle_queue.put(ohlc)
     except asyncio.CancelledError:
         raise
     finally:
         await client.disconnect()
 
 
+async def process_candles(
+    candle_queue: asyncio.Queue,
+    engine: StrategyEngine,
+    server: SignalServiceServer,
+    max_batch: int = 64,
+):
+    """Drain the candle queue and run batches through the engine.
+
+    Candles from all timeframe streams that land in the same event-loop
+    window are coalesced into one engine call, amortizing per-candle task
+    scheduling. A single consumer preserves per-symbol candle ordering,
+    which the engine's dedupe and position state rely on.
+    """
+    while True:
+        batch = [await candle_queue.get()]
+        while len(batch) < max_batch:
+            try:
+                batch.append(candle_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        signals = await engine.process_candles(batch)
+        for signal in signals:
+            await server.emit_signal(signal)
+
+
 async def main():
     """Run the Signal Service."""
     settings = Settings(
         database_url=os.getenv("DATABASE_URL", "postgresql:///varon_fi?user=varon"),
         dataservice_addr=os.getenv("DATASERVICE_GRPC_ADDR", "localhost:50051"),
         signalservice_port=int(os.getenv("SIGNALSERVICE_GRPC_PORT", "50052")),
+        prewarm_ohlcs=os.getenv("SIGNAL_PREWARM_OHLCS", "").lower() in {"1", "true", "yes"},
     )
 
     # Initialize strategy engine (loads strategies from DB)
-    engine = StrategyEngine(settings.database_url)
+    engine = StrategyEngine(settings.database_url, prewarm_ohlcs=settings.prewarm_ohlcs)
     await engine.initialize()
 
     # Get required subscriptions from strategies (retry until at least one is active)
@@ -66,31 +89,36 @@ async def main():
     server = SignalServiceServer(engine, port=settings.signalservice_port)
     await server.start()
 
-    # Create streaming tasks for each timeframe
-    tasks = []
-    for timeframe, symbols in subscriptions.items():
-        task = asyncio.create_task(
-            stream_for_timeframe(
-                engine, server, settings.dataservice_addr, symbols, timeframe
-            ),
-            name=f"stream_{timeframe}",
-        )
-        tasks.append(task)
-
+    # Producers per timeframe feed one bounded queue drained by a single
+    # consumer running the engine. The TaskGroup owns all task lifecycles:
+    # if any task fails the rest are cancelled deterministically, with no
+    # manual cancel loop or double gather.
+    candle_queue: asyncio.Queue = asyncio.Queue(maxsize=256)
     try:
-        # Run all streaming tasks concurrently
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(
+                process_candles(candle_queue, engine, server),
+                name="process_candles",
+            )
+            for timeframe, symbols in subscriptions.items():
+                tg.create_task(
+                    stream_for_timeframe(
+                        candle_queue, settings.dataservice_addr, symbols, timeframe
+                    ),
+                    name=f"stream_{timeframe}",
+                )
     except asyncio.CancelledError:
         pass
     finally:
-        # Cancel all streaming tasks
-        for task in tasks:
-            if not task.done():
-                task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
         await server.stop()
         await engine.shutdown()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import inspect
 import json
 import subprocess
-import uuid
+import time
+from contextlib import AsyncExitStack, suppress
 from datetime import datetime, timezone
+from os import urandom
 from pathlib import Path
 from typing import Optional
 
 import asyncpg
+import numpy as np
 import pandas as pd
+
+try:  # optional fast JSON path (installed via the `perf` extra)
+    import orjson
+except ImportError:
+    orjson = None
 from google.protobuf.timestamp_pb2 import Timestamp
 from structlog import get_logger
 
@@ -22,8 +31,76 @@ from varon_fi.proto.varon_fi_pb2 import TraceContext, TradeSignal
 
 logger = get_logger(__name__)
 
+__all__ = ["StrategyEngine", "SUPPORTED_STRATEGY_NAMES"]
+
 SUPPORTED_STRATEGY_NAMES = {"range_mean_reversion"}
 
+# Hot-path SQL is defined once at module level; asyncpg keys its automatic
+# per-connection prepared-statement cache on the query text, so every pool
+# connection parses/plans these exactly once.
+_INSTRUMENT_ID_SQL = """
+SELECT id FROM instruments WHERE symbol = $1
+"""
+
+# NUMERIC columns are cast server-side so asyncpg decodes float8 directly
+# instead of handing back Decimal objects that pandas must re-coerce.
+# The by-id variant skips the instruments join once the symbol's id is
+# known from the startup cache.
+_FETCH_HISTORY_BY_ID_SQL = """
+SELECT ts as timestamp,
+       open::float8 AS open,
+       high::float8 AS high,
+       low::float8 AS low,
+       close::float8 AS close,
+       volume::float8 AS volume
+FROM ohlcs
+WHERE instrument_id = $1 AND timeframe = $2
+ORDER BY ts DESC
+LIMIT $3
+"""
+
+_FETCH_HISTORY_SQL = """
+SELECT ts as timestamp,
+       open::float8 AS open,
+       high::float8 AS high,
+       low::float8 AS low,
+       close::float8 AS close,
+       volume::float8 AS volume
+FROM ohlcs o
+JOIN instruments i ON o.instrument_id = i.id
+WHERE i.symbol = $1 AND o.timeframe = $2
+ORDER BY ts DESC
+LIMIT $3
+"""
+
+_INSERT_SIGNAL_SQL = """
+INSERT INTO signals
+(exchange_id, instrument_id, strategy_id, strategy_version,
+ signal_type, signal_value, confidence, payload,
+ idempotency_key, correlation_id)
+VALUES (1, $1, $2, $3, $4, $5, $6, $7, $8, $9)
+RETURNING id
+"""
+
+
+def _new_id() -> str:
+    """Random 128-bit hex id; skips the UUID object and dash formatting."""
+    return urandom(16).hex()
+
+
+def _json_dumps(obj) -> str:
+    """Serialize params/meta payloads, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY, default=str).decode()
+    return json.dumps(obj, default=str)
+
+
+def _json_loads(raw):
+    """Parse params/meta payloads, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class StrategyEngine:
     """Manages live strategies and generates signals."""
@@ -31,17 +108,40 @@ class StrategyEngine:
     def __init__(
         self,
         database_url: str,
+        prewarm_ohlcs: bool = False,
     ):
         self.database_url = database_url
+        self.prewarm_ohlcs = prewarm_ohlcs
+        self._prewarm_task: Optional[asyncio.Task] = None
         self.pool: Optional[asyncpg.Pool] = None
         self.strategies: dict[str, BaseStrategy] = {}
-        # Track last processed candle per strategy/symbol/timeframe to prevent duplicate signals.
-        self._last_candle_ts: dict[str, datetime] = {}
+        # Track last processed candle per strategy/symbol/timeframe to prevent
+        # duplicate signals; stored as int64 epoch-nanoseconds so the
+        # per-candle dedupe is a plain integer compare.
+        self._last_candle_ts: dict[tuple[str, str, str], int] = {}
         # Track warmup requirements per strategy/symbol/timeframe.
-        self._warmup_required: dict[str, int] = {}
-        self._warmup_complete: dict[str, bool] = {}
+        self._warmup_required: dict[tuple[str, str, str], int] = {}
+        self._warmup_complete: dict[tuple[str, str, str], bool] = {}
+        # Precomputed (required, lookback_bars) per strategy/symbol/timeframe
+        # so the per-candle loop skips the params dict walk and bar math.
+        self._hist_plan: dict[tuple[str, str, str], tuple[int, int]] = {}
         # Track latest candle timestamp seen at startup per symbol/timeframe.
-        self._startup_latest_ts: dict[str, datetime] = {}
+        self._startup_latest_ts: dict[tuple[str, str], datetime] = {}
+        # Rolling OHLC history per symbol/timeframe, maintained from the live
+        # stream so steady-state candles skip the per-candle Postgres SELECT.
+        # Maps (symbol, timeframe) -> (capacity_bars, DataFrame).
+        self._history_cache: dict[tuple[str, str], tuple[int, pd.DataFrame]] = {}
+        # Bars known to exist per symbol/timeframe (seeded at startup, bumped
+        # per live candle); used to skip fetches while warmup is hopeless.
+        self._bar_count: dict[tuple[str, str], int] = {}
+        # Instruments are effectively static; symbol -> id is preloaded at
+        # initialize and lazily filled on miss so _persist_signal skips its
+        # per-signal lookup round trip.
+        self._instrument_ids: dict[str, int] = {}
+        # Inverted dispatch index (symbol, timeframe) -> [(key, strategy)],
+        # rebuilt on load/reload or when self.strategies is swapped out.
+        self._dispatch_index: dict[tuple[str, str], list[tuple[str, BaseStrategy]]] = {}
+        self._dispatch_state: tuple[int, int] = (0, -1)
         # Lightweight instrumentation counters for per-candle evaluation health.
         self._metrics: dict[str, int] = {
             "candles_processed": 0,
@@ -56,19 +156,78 @@ class StrategyEngine:
 
     async def initialize(self):
         """Initialize DB connection and load active strategies."""
-        self.pool = await asyncpg.create_pool(self.database_url)
+        # A roomy statement cache keeps every hot-path query's parsed plan
+        # resident per connection; the queries themselves are module-level
+        # constants so asyncpg's text-keyed cache always hits.
+        self.pool = await asyncpg.create_pool(
+            self.database_url,
+            statement_cache_size=1024,
+            init=self._init_pool_connection,
+        )
+        if self.prewarm_ohlcs:
+            # Background task: warming the buffer cache must not delay
+            # startup, it only has to beat the first few hundred candles.
+            self._prewarm_task = asyncio.create_task(self._prewarm_ohlcs_table())
+        await self._preload_instrument_ids()
         await self._load_strategies()
         await self._initialize_startup_state()
         await self._initialize_positions_state()
         logger.info("StrategyEngine initialized", strategy_count=len(self.strategies))
 
+    async def _prewarm_ohlcs_table(self):
+        """Pull the recent ohlcs working set into the Postgres buffer cache.
+
+        Opt-in (it competes for shared_buffers): prefers pg_prewarm and
+        falls back to a cheap recent-range scan when the extension is not
+        installed, so cold-start candle fetches hit RAM instead of disk.
+        """
+        assert self.pool is not None
+        try:
+            async with self.pool.acquire() as conn:
+                try:
+                    await conn.execute("SELECT pg_prewarm('ohlcs')")
+                except asyncpg.PostgresError:
+                    await conn.fetchval(
+                        "SELECT count(*) FROM ohlcs WHERE ts > now() - interval '30 days'"
+                    )
+            logger.info("ohlcs prewarm complete")
+        except Exception as exc:
+            logger.warning("ohlcs prewarm failed", error=str(exc))
+
+    @staticmethod
+    async def _init_pool_connection(conn: asyncpg.Connection):
+        """Per-connection setup: decode jsonb columns straight to objects.
+
+        Lets strategy params/meta and signal payloads cross the driver as
+        dicts without a Python-side json.loads per row; the isinstance
+        branches downstream stay as fallbacks for string inputs from other
+        sources.
+        """
+        await conn.set_type_codec(
+            "jsonb",
+            encoder=_json_dumps,
+            decoder=_json_loads,
+            schema="pg_catalog",
+            format="text",
+        )
+
+    async def _preload_instrument_ids(self):
+        """Warm the symbol -> instrument id cache from the instruments table."""
+        assert self.pool is not None
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch("SELECT symbol, id FROM instruments")
+        self._instrument_ids = {str(row["symbol"]): row["id"] for row in rows}
+
     async def reload_strategies(self):
         """Reload strategies from the database."""
         self.strategies.clear()
         self._warmup_required.clear()
         self._warmup_complete.clear()
+        self._hist_plan.clear()
         self._strategy_fingerprints.clear()
         self._fingerprint_logged_combos.clear()
+        self._history_cache.clear()
+        self._bar_count.clear()
         await self._load_strategies()
         await self._initialize_startup_state()
         await self._initialize_positions_state()
@@ -137,10 +296,16 @@ class StrategyEngine:
             init_periods = row.get("init_periods") if isinstance(row, dict) else row.get("init_periods")
             for symbol in strategy.symbols:
                 for timeframe in strategy.timeframes:
-                    warmup_key = f"{strategy_key}:{symbol}:{timeframe}"
+                    warmup_key = (strategy_key, symbol, timeframe)
                     required = int(init_periods) if init_periods else 0
                     self._warmup_required[warmup_key] = required
                     self._warmup_complete[warmup_key] = required == 0
+                    self._hist_plan[warmup_key] = (
+                        required,
+                        self._calc_lookback_bars(
+                            timeframe, (strategy.params or {}).get("lookback_days")
+                        ),
+                    )
                     logger.info(
                         "Strategy warmup initialized",
                         strategy=strategy.name,
@@ -149,6 +314,25 @@ class StrategyEngine:
                         min_bars=required,
                     )
 
+        # Explicit rebuild: an in-place clear-and-reload keeps the same dict
+        # identity and possibly the same size, which the lazy check misses.
+        self._rebuild_dispatch_index()
+
+    def _rebuild_dispatch_index(self):
+        """Rebuild the (symbol, timeframe) -> strategies dispatch index.
+
+        process_candle_signals rebuilds lazily when the strategies mapping
+        is replaced or changes size, so callers that assign
+        ``engine.strategies`` directly stay supported.
+        """
+        index: dict[tuple[str, str], list[tuple[str, BaseStrategy]]] = {}
+        for strategy_key, strategy in self.strategies.items():
+            for sym in strategy.symbols:
+                for tf in strategy.timeframes:
+                    index.setdefault((sym, tf), []).append((strategy_key, strategy))
+        self._dispatch_index = index
+        self._dispatch_state = (id(self.strategies), len(self.strategies))
+
     def _create_strategy(self, row: asyncpg.Record) -> Optional[BaseStrategy]:
         """Instantiate a strategy from DB row."""
         name = row.get("name") if isinstance(row, dict) else row["name"]
@@ -165,7 +349,7 @@ class StrategyEngine:
             logger.warning("Strategy missing params; defaulting to empty", name=name)
             params: dict = {}
         else:
-            parsed_params = json.loads(raw_params) if isinstance(raw_params, str) else raw_params
+            parsed_params = _json_loads(raw_params) if isinstance(raw_params, str) else raw_params
             if not isinstance(parsed_params, dict):
                 logger.warning("Strategy params must be object; defaulting to empty", name=name)
                 params = {}
@@ -173,7 +357,7 @@ class StrategyEngine:
                 params = parsed_params
 
         raw_meta = row.get("meta") if isinstance(row, dict) else row["meta"]
-        meta = json.loads(raw_meta) if isinstance(raw_meta, str) else (raw_meta or {})
+        meta = _json_loads(raw_meta) if isinstance(raw_meta, str) else (raw_meta or {})
         if not isinstance(meta, dict):
             logger.warning("Strategy config meta must be object; ignoring", name=name, meta_type=type(meta).__name__)
             meta = {}
@@ -305,32 +489,43 @@ class StrategyEngine:
                 for timeframe in strategy.timeframes:
                     combos.add((symbol, timeframe))
 
+        # One grouped probe covers every combo instead of a MAX(ts) round
+        # trip per (symbol, timeframe); the cross-product rows the ANY
+        # filters allow beyond the actual combos are discarded client-side.
         async with self.pool.acquire() as conn:
-            for symbol, timeframe in combos:
-                row = await conn.fetchrow(
-                    """
-                    SELECT MAX(ts) as ts
-                    FROM ohlcs o
-                    JOIN instruments i ON o.instrument_id = i.id
-                    WHERE i.symbol = $1 AND o.timeframe = $2
-                    """,
-                    symbol,
-                    timeframe,
-                )
-                if row and row["ts"]:
-                    self._startup_latest_ts[f"{symbol}:{timeframe}"] = row["ts"]
+            rows = await conn.fetch(
+                """
+                SELECT i.symbol, o.timeframe, MAX(o.ts) as ts
+                FROM ohlcs o
+                JOIN instruments i ON o.instrument_id = i.id
+                WHERE i.symbol = ANY($1::text[])
+                  AND o.timeframe = ANY($2::text[])
+                GROUP BY i.symbol, o.timeframe
+                """,
+                sorted({symbol for symbol, _ in combos}),
+                sorted({timeframe for _, timeframe in combos}),
+            )
+        for row in rows:
+            symbol = str(row["symbol"])
+            timeframe = str(row["timeframe"])
+            if (symbol, timeframe) in combos and row["ts"]:
+                self._startup_latest_ts[(symbol, timeframe)] = row["ts"]
 
         for strategy_id, strategy in self.strategies.items():
             lookback_days = (strategy.params or {}).get("lookback_days")
             for symbol in strategy.symbols:
                 for timeframe in strategy.timeframes:
-                    warmup_key = f"{strategy_id}:{symbol}:{timeframe}"
+                    warmup_key = (strategy_id, symbol, timeframe)
                     required = self._warmup_required.get(warmup_key, 0)
                     lookback_bars = self._calc_lookback_bars(timeframe, lookback_days)
                     bars_needed = max(required, lookback_bars) if lookback_bars else required
                     if bars_needed <= 0:
                         continue
                     history = await self._fetch_history(symbol, timeframe, bars=bars_needed)
+                    count_key = (symbol, timeframe)
+                    self._bar_count[count_key] = max(
+                        self._bar_count.get(count_key, 0), len(history)
+                    )
                     if len(history) >= required:
                         self._warmup_complete[warmup_key] = True
                         logger.info(
@@ -402,8 +597,8 @@ class StrategyEngine:
                     payload = row["payload"]
                     if isinstance(payload, str):
                         try:
-                            payload = json.loads(payload) if payload else {}
-                        except json.JSONDecodeError:
+                            payload = _json_loads(payload) if payload else {}
+                        except ValueError:
                             payload = {}
                     payload = payload or {}
                     try:
@@ -467,19 +662,32 @@ class StrategyEngine:
             except Exception:
                 return True
 
-        params = getattr(strategy, "params", None) or {}
-        session_start = params.get("session_start") or getattr(strategy, "session_start", None)
-        session_end = params.get("session_end") or getattr(strategy, "session_end", None)
-        if not session_start or not session_end:
-            return True
+        # Session params never change for a loaded strategy, so the string
+        # parsing happens once and the result is memoized on the instance
+        # (empty tuple meaning "no session window").
+        window = getattr(strategy, "_session_window_cache", None)
+        if window is None:
+            params = getattr(strategy, "params", None) or {}
+            session_start = params.get("session_start") or getattr(strategy, "session_start", None)
+            session_end = params.get("session_end") or getattr(strategy, "session_end", None)
+            if not session_start or not session_end:
+                window = ()
+            else:
+                if isinstance(session_start, str):
+                    session_start = datetime.strptime(session_start, "%H:%M").time()
+                if isinstance(session_end, str):
+                    session_end = datetime.strptime(session_end, "%H:%M").time()
+                window = (session_start, session_end)
+            try:
+                strategy._session_window_cache = window
+            except AttributeError:
+                pass
 
-        if isinstance(session_start, str):
-            session_start = datetime.strptime(session_start, "%H:%M").time()
-        if isinstance(session_end, str):
-            session_end = datetime.strptime(session_end, "%H:%M").time()
+        if not window:
+            return True
 
-        current_time = candle_ts.time()
-        return session_start <= current_time <= session_end
+        session_start, session_end = window
+        return session_start <= candle_ts.time() <= session_end
 
     async def process_candle_signals(self, ohlc: dict) -> list[Signal]:
         """Process an OHLC candle and return all generated signals."""
@@ -487,22 +695,70 @@ class StrategyEngine:
         timeframe = ohlc.get("timeframe")
 
         signals: list[Signal] = []
-        strategies_evaluated = 0
         signals_emitted = 0
 
-        for strategy_key, strategy in self.strategies.items():
-            if symbol not in strategy.symbols or timeframe not in strategy.timeframes:
-                continue
-
-            strategies_evaluated += 1
-            strategy_id = str(getattr(strategy, "strategy_id", "") or strategy_key.split(":", 1)[0])
+        if self._dispatch_state != (id(self.strategies), len(self.strategies)):
+            self._rebuild_dispatch_index()
+        matching = self._dispatch_index.get((symbol, timeframe), [])
+        strategies_evaluated = len(matching)
+        if not matching:
+            self._metrics["candles_processed"] += 1
+            return signals
+
+        # History is shared across all strategies on this (symbol, timeframe),
+        # so fetch once at the largest lookback any of them needs instead of
+        # issuing one query per strategy. While counting, also find the
+        # smallest outstanding warmup requirement so a hopeless candle can
+        # skip the fetch entirely.
+        count_key = (symbol, timeframe)
+        bars_seen = self._bar_count.get(count_key, 0) + 1
+        self._bar_count[count_key] = bars_seen
+
+        bars_needed = 200
+        min_outstanding: Optional[int] = None
+        for strategy_key, strategy in matching:
+            warmup_key = (strategy_key, symbol, timeframe)
+            plan = self._hist_plan.get(warmup_key)
+            if plan is None:
+                # Strategy injected without going through _load_strategies
+                # (tests, ad hoc): compute once and cache.
+                plan = (
+                    self._warmup_required.get(warmup_key, 0),
+                    self._calc_lookback_bars(
+                        timeframe, (strategy.params or {}).get("lookback_days")
+                    ),
+                )
+                self._hist_plan[warmup_key] = plan
+            required, lookback_bars = plan
+            bars_needed = max(bars_needed, required, lookback_bars)
+            outstanding = required if not self._warmup_complete.get(warmup_key, True) else 0
+            if min_outstanding is None or outstanding < min_outstanding:
+                min_outstanding = outstanding
+
+        if min_outstanding is not None and min_outstanding > bars_seen:
+            logger.debug(
+                "Skipping candle - all strategies still warming up",
+                symbol=symbol,
+                timeframe=timeframe,
+                bars_seen=bars_seen,
+                min_required=min_outstanding,
+            )
+            self._metrics["candles_processed"] += 1
+            self._metrics["strategies_evaluated"] += strategies_evaluated
+            return signals
+
+        async with AsyncExitStack() as stack:
+            # One pool acquire covers the history fetch and every signal
+            # INSERT for this candle instead of re-acquiring per query.
+            conn = (
+                await stack.enter_async_context(self.pool.acquire())
+                if self.pool is not None
+                else None
+            )
 
-            warmup_key = f"{strategy_key}:{symbol}:{timeframe}"
-            required = self._warmup_required.get(warmup_key, 0)
-            lookback_days = (strategy.params or {}).get("lookback_days")
-            lookback_bars = self._calc_lookback_bars(timeframe, lookback_days)
-            bars_needed = max(200, required, lookback_bars) if lookback_bars else max(200, required)
-            history = await self._fetch_history(symbol, timeframe, bars=bars_needed)
+            history = await self._history_for_candle(
+                symbol, timeframe, ohlc, bars=bars_needed, conn=conn
+            )
             confirmed_ohlc, confirmed_history = self._confirmed_candle_view(
                 symbol=symbol,
                 timeframe=timeframe,
@@ -511,85 +767,123 @@ class StrategyEngine:
             )
             if confirmed_ohlc is None or confirmed_history.empty:
                 logger.debug(
-                    "Skipping signal - no confirmed candle available",
-                    strategy=strategy.name,
+                    "Skipping candle - no confirmed candle available",
                     symbol=symbol,
                     timeframe=timeframe,
                 )
-                continue
+                self._metrics["candles_processed"] += 1
+                self._metrics["strategies_evaluated"] += strategies_evaluated
+                return signals
             confirmed_ts = self._normalize_candle_ts(
                 confirmed_ohlc.get("timestamp") or confirmed_ohlc.get("ts")
             )
+            # Converted once per candle; the per-strategy dedupe below is
+            # then a single int64 compare.
+            confirmed_ts_ns = (
+                int(confirmed_ts.timestamp() * 1_000_000_000)
+                if confirmed_ts is not None
+                else None
+            )
 
-            if not self._in_strategy_session(strategy, confirmed_ts):
-                continue
+            # SoA arrays for strategies implementing the on_bars fast path; built
+            # lazily and shared by every such strategy on this candle.
+            bars_arrays: Optional[tuple[np.ndarray, ...]] = None
 
-            if confirmed_ts is not None:
-                startup_key = f"{symbol}:{timeframe}"
-                startup_ts = self._startup_latest_ts.get(startup_key)
-                if startup_ts is not None and confirmed_ts <= startup_ts:
-                    continue
+            for strategy_key, strategy in matching:
+                strategy_id = str(getattr(strategy, "strategy_id", "") or strategy_key.split(":", 1)[0])
+
+                warmup_key = (strategy_key, symbol, timeframe)
+                required = self._warmup_required.get(warmup_key, 0)
 
-            if confirmed_ts is not None:
-                dedupe_key = f"{strategy_key}:{symbol}:{timeframe}"
-                last_ts = self._last_candle_ts.get(dedupe_key)
-                if last_ts is not None and confirmed_ts <= last_ts:
+                if not self._in_strategy_session(strategy, confirmed_ts):
                     continue
-                self._last_candle_ts[dedupe_key] = confirmed_ts
 
-            if required > 0 and not self._warmup_complete.get(warmup_key, True):
-                if len(confirmed_history) < required:
-                    logger.debug(
-                        "Skipping signal - warmup in progress",
+                if confirmed_ts is not None:
+                    startup_key = (symbol, timeframe)
+                    startup_ts = self._startup_latest_ts.get(startup_key)
+                    if startup_ts is not None and confirmed_ts <= startup_ts:
+                        continue
+
+                if confirmed_ts_ns is not None:
+                    dedupe_key = (strategy_key, symbol, timeframe)
+                    last_ts_ns = self._last_candle_ts.get(dedupe_key)
+                    if last_ts_ns is not None and confirmed_ts_ns <= last_ts_ns:
+                        continue
+                    self._last_candle_ts[dedupe_key] = confirmed_ts_ns
+
+                if required > 0 and not self._warmup_complete.get(warmup_key, True):
+                    if len(confirmed_history) < required:
+                        logger.debug(
+                            "Skipping signal - warmup in progress",
+                            strategy=strategy.name,
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            history_bars=len(confirmed_history),
+                            required_bars=required,
+                        )
+                        continue
+                    self._warmup_complete[warmup_key] = True
+                    logger.info(
+                        "Strategy warmup complete",
                         strategy=strategy.name,
                         symbol=symbol,
                         timeframe=timeframe,
                         history_bars=len(confirmed_history),
-                        required_bars=required,
                     )
-                    continue
-                self._warmup_complete[warmup_key] = True
-                logger.info(
-                    "Strategy warmup complete",
-                    strategy=strategy.name,
+
+                self._emit_first_candle_fingerprint(
+                    strategy_id=strategy_key,
                     symbol=symbol,
                     timeframe=timeframe,
-                    history_bars=len(confirmed_history),
                 )
 
-            self._emit_first_candle_fingerprint(
-                strategy_id=strategy_key,
-                symbol=symbol,
-                timeframe=timeframe,
-            )
+                # Strategies may implement on_bars(o, h, l, c, v, ts) over float64
+                # arrays to bypass DataFrame overhead; on_candle stays the
+                # DataFrame-based default.
+                on_bars = getattr(strategy, "on_bars", None)
+                if callable(on_bars):
+                    if bars_arrays is None:
+                        bars_arrays = self._history_arrays(confirmed_history)
+                    signal = on_bars(*bars_arrays)
+                else:
+                    signal = strategy.on_candle(confirmed_ohlc, confirmed_history)
+                if not signal:
+                    continue
 
-            signal = strategy.on_candle(confirmed_ohlc, confirmed_history)
-            if not signal:
-                continue
+                # No-op signals are not worth an INSERT and a broadcast;
+                # "flat" stays — it is a real exit downstream must see.
+                side = (signal.side or "").lower()
+                if not side or side == "hold":
+                    self._metrics["signals_dropped"] += 1
+                    continue
 
-            signal.strategy_id = strategy_id
-            signal.strategy_version = strategy.version
-            signal.symbol = symbol
-            signal.timeframe = timeframe
+                signal.strategy_id = strategy_id
+                signal.strategy_version = strategy.version
+                signal.symbol = symbol
+                signal.timeframe = timeframe
 
-            if signal.meta is None:
-                signal.meta = {}
+                if signal.meta is None:
+                    signal.meta = {}
 
-            self._attach_strategy_fingerprint_meta(signal, strategy_key)
+                self._attach_strategy_fingerprint_meta(signal, strategy_key)
 
-            signal_db_id = await self._persist_signal(signal)
-            if signal_db_id:
-                signal.signal_db_id = signal_db_id
+                signal_db_id = (
+                    await self._persist_signal(signal)
+                    if conn is None
+                    else await self._persist_signal(signal, conn)
+                )
+                if signal_db_id:
+                    signal.signal_db_id = signal_db_id
 
-            logger.info(
-                "Signal generated",
-                strategy=strategy.name,
-                symbol=symbol,
-                side=signal.side,
-                correlation_id=signal.correlation_id,
-            )
-            signals.append(signal)
-            signals_emitted += 1
+                logger.info(
+                    "Signal generated",
+                    strategy=strategy.name,
+                    symbol=symbol,
+                    side=signal.side,
+                    correlation_id=signal.correlation_id,
+                )
+                signals.append(signal)
+                signals_emitted += 1
 
         self._metrics["candles_processed"] += 1
         self._metrics["strategies_evaluated"] += strategies_evaluated
@@ -619,12 +913,17 @@ class StrategyEngine:
         if history.empty:
             return None, history
 
-        history_df = history.copy()
-        ts_col = "timestamp" if "timestamp" in history_df.columns else "ts" if "ts" in history_df.columns else None
+        ts_col = "timestamp" if "timestamp" in history.columns else "ts" if "ts" in history.columns else None
         if ts_col is None:
-            return None, history_df.iloc[0:0]
+            return None, history.iloc[0:0]
 
-        history_df = history_df.sort_values(ts_col).reset_index(drop=True)
+        # _fetch_history already returns ascending frames; sort_values makes
+        # its own copy, so the extra defensive copy per candle is redundant
+        # and only needed for unsorted frames handed in by callers.
+        if history[ts_col].is_monotonic_increasing:
+            history_df = history
+        else:
+            history_df = history.sort_values(ts_col).reset_index(drop=True)
         incoming_ts = self._normalize_candle_ts(incoming_ohlc.get("timestamp") or incoming_ohlc.get("ts"))
 
         # When a new bar first appears in `ohlcs`, it is still forming and may be
@@ -647,8 +946,12 @@ class StrategyEngine:
             "close": float(confirmed["close"]),
             "volume": float(confirmed["volume"]),
         }
-        if "count" in confirmed.index and confirmed["count"] is not None and not pd.isna(confirmed["count"]):
-            confirmed_ohlc["count"] = int(confirmed["count"])
+        if "count" in confirmed.index:
+            count_val = confirmed["count"]
+            # Scalar NaN check without pd.isna's NA-machinery dispatch
+            # (NaN != NaN is the one float that fails self-equality).
+            if count_val is not None and count_val == count_val:
+                confirmed_ohlc["count"] = int(count_val)
 
         return confirmed_ohlc, history_df
 
@@ -657,6 +960,13 @@ class StrategyEngine:
         signals = await self.process_candle_signals(ohlc)
         return signals[0] if signals else None
 
+    async def process_candles(self, ohlcs: list[dict]) -> list[Signal]:
+        """Process a batch of candles in arrival order, aggregating signals."""
+        signals: list[Signal] = []
+        for ohlc in ohlcs:
+            signals.extend(await self.process_candle_signals(ohlc))
+        return signals
+
     def get_metrics_snapshot(self) -> dict[str, int]:
         """Return a copy of lightweight processing counters."""
         return dict(self._metrics)
@@ -666,14 +976,31 @@ class StrategyEngine:
         if ts is None:
             return None
 
-        if isinstance(ts, (int, float)):
-            dt = datetime.fromtimestamp(ts, timezone.utc)
+        # Fast path first: plain datetimes are what the history cache and
+        # confirmed-candle view hand in on every call, and the tz-aware UTC
+        # case passes through without any allocation.
+        ts_type = type(ts)
+        if ts_type is datetime:
+            tzinfo = ts.tzinfo
+            if tzinfo is timezone.utc:
+                return ts
+            if tzinfo is None:
+                return ts.replace(tzinfo=timezone.utc)
+            return ts.astimezone(timezone.utc)
+
+        if ts_type is int or ts_type is float:
+            return datetime.fromtimestamp(ts, timezone.utc)
+
+        if hasattr(ts, "seconds") and hasattr(ts, "nanos"):
+            # Proto Timestamp: read fields directly, keeping sub-second
+            # precision instead of truncating to whole seconds.
+            return datetime.fromtimestamp(ts.seconds + ts.nanos * 1e-9, timezone.utc)
+
+        if isinstance(ts, str):
+            dt = pd.to_datetime(ts)
         elif isinstance(ts, datetime):
+            # datetime subclass, e.g. pd.Timestamp
             dt = ts
-        elif hasattr(ts, "seconds") and hasattr(ts, "nanos"):
-            dt = datetime.fromtimestamp(ts.seconds, timezone.utc)
-        elif isinstance(ts, str):
-            dt = pd.to_datetime(ts)
         elif hasattr(ts, "ToDatetime"):
             dt = ts.ToDatetime(tzinfo=timezone.utc)
         else:
@@ -683,30 +1010,45 @@ class StrategyEngine:
             dt = dt.to_pydatetime()
 
         if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt = dt.astimezone(timezone.utc)
-
-        return dt
+            return dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
 
     def _to_trade_signal(self, signal: Signal, signal_db_id: Optional[str] = None) -> TradeSignal:
         """Convert internal Signal to TradeSignal protobuf."""
-        now = datetime.now(timezone.utc)
-        timestamp = Timestamp()
-        timestamp.FromDatetime(now)
+        # time_ns -> proto fields directly; no datetime/tzinfo allocations
+        # and no precision loss through float seconds.
+        now_ns = time.time_ns()
+        timestamp = Timestamp(
+            seconds=now_ns // 1_000_000_000, nanos=now_ns % 1_000_000_000
+        )
 
         meta = self._normalize_meta(signal.meta)
+        # Stringify values only when there is meta to convert; the common
+        # flat-exit signal carries none.
+        if meta:
+            meta = {str(k): "" if v is None else str(v) for k, v in meta.items()}
+
+        # Signals normally arrive with both ids populated; when they are
+        # missing, generate a single fallback id and reuse it so the emitted
+        # trace/signal ids stay correlated instead of burning three urandom
+        # reads per signal.
+        correlation_id = signal.correlation_id
+        idempotency_key = signal.idempotency_key
+        if not correlation_id or not idempotency_key:
+            fallback_id = _new_id()
+            correlation_id = correlation_id or fallback_id
+            idempotency_key = idempotency_key or fallback_id
 
         trace = TraceContext(
-            correlation_id=signal.correlation_id if signal.correlation_id else str(uuid.uuid4()),
-            idempotency_key=signal.idempotency_key if signal.idempotency_key else str(uuid.uuid4()),
+            correlation_id=correlation_id,
+            idempotency_key=idempotency_key,
             source_service="signal-service",
             latency_ms=0,
             timestamp=timestamp,
         )
 
         return TradeSignal(
-            signal_id=signal_db_id or signal.idempotency_key or str(uuid.uuid4()),
+            signal_id=signal_db_id or idempotency_key,
             strategy_id=signal.strategy_id or "",
             strategy_version=signal.strategy_version or "",
             symbol=signal.symbol or "",
@@ -714,7 +1056,7 @@ class StrategyEngine:
             side=signal.side,
             price=signal.price or 0.0,
             confidence=signal.confidence,
-            meta={str(k): "" if v is None else str(v) for k, v in meta.items()},
+            meta=meta,
             trace=trace,
         )
 
@@ -726,81 +1068,212 @@ class StrategyEngine:
             return meta_value
         if isinstance(meta_value, str):
             try:
-                return json.loads(meta_value) if meta_value else {}
-            except json.JSONDecodeError:
+                return _json_loads(meta_value) if meta_value else {}
+            except ValueError:
                 logger.warning(f"Failed to parse meta as JSON: {meta_value[:100]}...")
                 return {}
         logger.warning(f"Unexpected meta type {type(meta_value)}, using empty dict")
         return {}
 
-    async def _fetch_history(self, symbol: str, timeframe: str, bars: int = 200) -> pd.DataFrame:
-        """Fetch recent OHLC history from canonical ohlcs table."""
+    def _history_arrays(self, history: pd.DataFrame) -> tuple[np.ndarray, ...]:
+        """Build SoA float64 arrays (open, high, low, close, volume, epoch ts)."""
+        ts_col = "timestamp" if "timestamp" in history.columns else "ts"
+        ts = pd.to_datetime(history[ts_col], utc=True).astype("int64").to_numpy() / 1e9
+        # ascontiguousarray is a no-op when to_numpy already produced an owned
+        # C-contiguous buffer; when pandas hands back a strided block view it
+        # forces the copy here, once, instead of inside every vectorized
+        # kernel a strategy feeds these arrays to.
+        return (
+            np.ascontiguousarray(history["open"].to_numpy(), dtype=np.float64),
+            np.ascontiguousarray(history["high"].to_numpy(), dtype=np.float64),
+            np.ascontiguousarray(history["low"].to_numpy(), dtype=np.float64),
+            np.ascontiguousarray(history["close"].to_numpy(), dtype=np.float64),
+            np.ascontiguousarray(history["volume"].to_numpy(), dtype=np.float64),
+            ts,
+        )
+
+    def _timeframe_seconds(self, timeframe: str) -> int:
+        """Convert a timeframe string to its bar duration in seconds."""
+        tf = str(timeframe or "").strip().lower()
+        try:
+            if tf.endswith("m"):
+                return int(tf[:-1]) * 60
+            if tf.endswith("h"):
+                return int(tf[:-1]) * 3600
+            if tf.endswith("d"):
+                return int(tf[:-1] if tf[:-1] else 1) * 86400
+        except Exception:
+            return 0
+        return 0
+
+    async def _history_for_candle(
+        self,
+        symbol: str,
+        timeframe: str,
+        ohlc: dict,
+        bars: int = 200,
+        conn: Optional[asyncpg.Connection] = None,
+    ) -> pd.DataFrame:
+        """Return OHLC history for a live candle, preferring the rolling cache.
+
+        The stream already delivers every candle, so steady-state processing
+        appends (or reconciles) the incoming bar into the cached frame instead
+        of re-issuing the per-candle SELECT. Any surprise — cold cache, a gap
+        in the sequence, an out-of-order bar, a larger lookback than cached —
+        falls back to one authoritative fetch that reseeds the cache.
+        """
+        key = (symbol, timeframe)
+        incoming_ts = self._normalize_candle_ts(ohlc.get("timestamp") or ohlc.get("ts"))
+        step = self._timeframe_seconds(timeframe)
+        cached = self._history_cache.get(key)
+
+        if cached is not None and incoming_ts is not None and step > 0:
+            capacity, df = cached
+            if capacity >= bars and not df.empty:
+                last_ts = self._normalize_candle_ts(df.iloc[-1]["timestamp"])
+                if last_ts is not None:
+                    if incoming_ts == last_ts:
+                        # Same bar streamed again (still forming / reconciled):
+                        # refresh its values in place.
+                        df.iloc[-1, 1:] = [
+                            float(ohlc.get("open", 0.0)),
+                            float(ohlc.get("high", 0.0)),
+                            float(ohlc.get("low", 0.0)),
+                            float(ohlc.get("close", 0.0)),
+                            float(ohlc.get("volume", 0.0)),
+                        ]
+                        return df
+                    if (incoming_ts - last_ts).total_seconds() == step:
+                        row = pd.DataFrame(
+                            [
+                                {
+                                    "timestamp": incoming_ts,
+                                    "open": float(ohlc.get("open", 0.0)),
+                                    "high": float(ohlc.get("high", 0.0)),
+                                    "low": float(ohlc.get("low", 0.0)),
+                                    "close": float(ohlc.get("close", 0.0)),
+                                    "volume": float(ohlc.get("volume", 0.0)),
+                                }
+                            ]
+                        )
+                        df = pd.concat([df, row], ignore_index=True)
+                        if len(df) > capacity:
+                            df = df.iloc[-capacity:].reset_index(drop=True)
+                        self._history_cache[key] = (capacity, df)
+                        return df
+
+        history = await self._fetch_history(symbol, timeframe, bars=bars, conn=conn)
+        self._history_cache[key] = (bars, history)
+        return history
+
+    async def _fetch_history(
+        self,
+        symbol: str,
+        timeframe: str,
+        bars: int = 200,
+        conn: Optional[asyncpg.Connection] = None,
+    ) -> pd.DataFrame:
+        """Fetch recent OHLC history from canonical ohlcs table.
+
+        An already-acquired connection may be passed in so one pool acquire
+        can serve all of a candle's queries.
+        """
         bars = int(bars or 0)
         if bars <= 0:
             bars = 1
 
-        assert self.pool is not None
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT ts as timestamp, open, high, low, close, volume
-                FROM ohlcs o
-                JOIN instruments i ON o.instrument_id = i.id
-                WHERE i.symbol = $1 AND o.timeframe = $2
-                ORDER BY ts DESC
-                LIMIT $3
-                """,
-                symbol,
-                timeframe,
-                bars,
-            )
+        # With the instrument id cached, the hot query hits ohlcs directly
+        # and skips the per-call join against instruments.
+        instrument_id = self._instrument_ids.get(symbol)
+        if instrument_id is not None:
+            query, args = _FETCH_HISTORY_BY_ID_SQL, (instrument_id, timeframe, bars)
+        else:
+            query, args = _FETCH_HISTORY_SQL, (symbol, timeframe, bars)
 
-        df = pd.DataFrame(rows, columns=["timestamp", "open", "high", "low", "close", "volume"])
-        if df.empty:
-            return df
-        return df.sort_values("timestamp").reset_index(drop=True)
+        if conn is not None:
+            rows = await conn.fetch(query, *args)
+        else:
+            assert self.pool is not None
+            async with self.pool.acquire() as pooled:
+                rows = await pooled.fetch(query, *args)
+
+        if not rows:
+            return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
+
+        # The query returns newest-first, so an O(N) reversal replaces
+        # sort_values' sort-plus-index-rebuild; building each numeric column
+        # typed via np.fromiter avoids the object-dtype intermediate a frame
+        # of Record rows would produce.
+        rows = rows[::-1]
+        n = len(rows)
+        return pd.DataFrame(
+            {
+                "timestamp": [r["timestamp"] for r in rows],
+                "open": np.fromiter((r["open"] for r in rows), dtype=np.float64, count=n),
+                "high": np.fromiter((r["high"] for r in rows), dtype=np.float64, count=n),
+                "low": np.fromiter((r["low"] for r in rows), dtype=np.float64, count=n),
+                "close": np.fromiter((r["close"] for r in rows), dtype=np.float64, count=n),
+                "volume": np.fromiter((r["volume"] for r in rows), dtype=np.float64, count=n),
+            },
+            copy=False,
+        )
 
-    async def _persist_signal(self, signal: Signal) -> Optional[str]:
-        """Persist signal to database. Returns signal UUID (id)."""
-        assert self.pool is not None
-        async with self.pool.acquire() as conn:
-            instrument_id = await conn.fetchval(
-                """
-                SELECT id FROM instruments WHERE symbol = $1
-                """,
-                signal.symbol,
-            )
+    async def _persist_signal(
+        self, signal: Signal, conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[str]:
+        """Persist signal to database. Returns signal UUID (id).
 
+        An already-acquired connection may be passed in so one pool acquire
+        can serve all of a candle's queries.
+        """
+        if conn is not None:
+            return await self._persist_signal_on_conn(signal, conn)
+
+        assert self.pool is not None
+        async with self.pool.acquire() as pooled:
+            return await self._persist_signal_on_conn(signal, pooled)
+
+    async def _persist_signal_on_conn(
+        self, signal: Signal, conn: asyncpg.Connection
+    ) -> Optional[str]:
+        instrument_id = self._instrument_ids.get(signal.symbol)
+        if instrument_id is None:
+            # Instrument added after startup: one lookup, then cached.
+            instrument_id = await conn.fetchval(_INSTRUMENT_ID_SQL, signal.symbol)
             if instrument_id is None:
                 logger.warning("Unknown instrument for signal", symbol=signal.symbol)
                 return None
-
-            signal_type = signal.side.upper() if signal.side else "UNKNOWN"
-            signal_value = float(signal.price) if signal.price else 0.0
-
-            row = await conn.fetchrow(
-                """
-                INSERT INTO signals
-                (exchange_id, instrument_id, strategy_id, strategy_version,
-                 signal_type, signal_value, confidence, payload,
-                 idempotency_key, correlation_id)
-                VALUES (1, $1, $2, $3, $4, $5, $6, $7, $8, $9)
-                RETURNING id
-                """,
-                instrument_id,
-                signal.strategy_id,
-                signal.strategy_version,
-                signal_type,
-                signal_value,
-                signal.confidence,
-                json.dumps(signal.meta),
-                signal.idempotency_key,
-                signal.correlation_id,
-            )
-            return str(row["id"]) if row else None
+            self._instrument_ids[signal.symbol] = instrument_id
+
+        signal_type = signal.side.upper() if signal.side else "UNKNOWN"
+        signal_value = float(signal.price) if signal.price else 0.0
+
+        row = await conn.fetchrow(
+            _INSERT_SIGNAL_SQL,
+            instrument_id,
+            signal.strategy_id,
+            signal.strategy_version,
+            signal_type,
+            signal_value,
+            signal.confidence,
+            # The pool's jsonb codec serializes the dict itself; passing a
+            # pre-dumped string here would get encoded a second time and
+            # store the payload as a JSON string instead of an object.
+            signal.meta or {},
+            signal.idempotency_key,
+            signal.correlation_id,
+        )
+        return str(row["id"]) if row else None
 
     async def shutdown(self):
         """Cleanup resources."""
+        if self._prewarm_task is not None:
+            # A still-running prewarm would hold a connection and stall
+            # pool.close(); cancel it rather than wait out the scan.
+            self._prewarm_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._prewarm_task
+            self._prewarm_task = None
         if self.pool:
             await self.pool.close()
         logger.info("StrategyEngine shutdown")
@@ -35,6 +35,9 @@ class RangeMeanReversionStrategy(BaseStrategy):
         )
         self._logic_params = load_params(raw_params)
         self._positions: dict[str, dict] = {}
+        # Timeframe strings seen by this instance are fixed per config, so
+        # each is parsed once and the minutes are memoized.
+        self._tf_minutes: dict[str, int] = {}
 
     def _position_key(self, candle: dict) -> str:
         symbol = candle.get("symbol")
@@ -67,16 +70,21 @@ class RangeMeanReversionStrategy(BaseStrategy):
 
     def _timeframe_minutes(self, candle: dict) -> int:
         timeframe = str(candle.get("timeframe") or "5m").strip().lower()
+        cached = self._tf_minutes.get(timeframe)
+        if cached is not None:
+            return cached
+        minutes = 5
         try:
             if timeframe.endswith("m"):
-                return max(1, int(timeframe[:-1]))
-            if timeframe.endswith("h"):
-                return max(1, int(timeframe[:-1]) * 60)
-            if timeframe.endswith("d"):
-                return max(1, int(timeframe[:-1]) * 24 * 60)
+                minutes = max(1, int(timeframe[:-1]))
+            elif timeframe.endswith("h"):
+                minutes = max(1, int(timeframe[:-1]) * 60)
+            elif timeframe.endswith("d"):
+                minutes = max(1, int(timeframe[:-1]) * 24 * 60)
         except Exception:
-            return 5
-        return 5
+            minutes = 5
+        self._tf_minutes[timeframe] = minutes
+        return minutes
 
     def on_candle(self, candle: dict, history: pd.DataFrame) -> Optional[Signal]:
         try:
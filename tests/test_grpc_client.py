@@ -0,0 +1,36 @@
+"""Tests for DataService client helpers."""
+
+import pytest
+
+from signal_service.grpc.client import OHLCView
+
+
+class FakeOHLCMessage:
+    symbol = "BTC"
+    timeframe = "5m"
+    timestamp = 1234567890
+    open = 1.0
+    high = 2.0
+    low = 0.5
+    close = 1.5
+    volume = 10.0
+    count = 3
+    other_field = "not exposed"
+
+
+def test_ohlc_view_exposes_known_fields():
+    view = OHLCView(FakeOHLCMessage())
+
+    assert view["close"] == 1.5
+    assert view.get("symbol") == "BTC"
+    assert "volume" in view
+
+
+def test_ohlc_view_hides_unknown_keys():
+    view = OHLCView(FakeOHLCMessage())
+
+    assert "other_field" not in view
+    assert view.get("other_field") is None
+    assert view.get("other_field", "fallback") == "fallback"
+    with pytest.raises(KeyError):
+        view["other_field"]
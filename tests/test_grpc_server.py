@@ -48,3 +48,63 @@ async def test_emit_signal_falls_back_when_persisted_signal_id_unavailable():
 
     emitted = await asyncio.wait_for(queue.get(), timeout=0.2)
     assert emitted.signal_id == "idem-2"
+
+
+@pytest.mark.asyncio
+async def test_broadcast_filters_non_matching_subscribers():
+    engine = StrategyEngine("postgresql://localhost/varon_fi")
+    server = SignalServiceServer(engine)
+    matching_queue: asyncio.Queue = asyncio.Queue()
+    other_queue: asyncio.Queue = asyncio.Queue()
+    server._subscribers.append(
+        (matching_queue, SignalSubscription(strategy_ids=["s1"], symbols=["BTC"]))
+    )
+    server._subscribers.append((other_queue, SignalSubscription(strategy_ids=["s9"])))
+    server._refresh_subscriber_snapshot()
+
+    await server.emit_signal(_make_signal("idem-3"))
+
+    emitted = await asyncio.wait_for(matching_queue.get(), timeout=0.2)
+    assert emitted.strategy_id == "s1"
+    assert other_queue.empty()
+
+
+class FakeStreamContext:
+    """Stand-in for the grpc.aio RPC context's done-callback hook."""
+
+    def __init__(self):
+        self._callbacks = []
+
+    def add_done_callback(self, callback):
+        self._callbacks.append(callback)
+
+    def close(self):
+        for callback in self._callbacks:
+            callback(self)
+
+
+@pytest.mark.asyncio
+async def test_stream_signals_yields_then_ends_on_disconnect():
+    engine = StrategyEngine("postgresql://localhost/varon_fi")
+    server = SignalServiceServer(engine)
+    context = FakeStreamContext()
+    stream = server._impl.StreamSignals(SignalSubscription(), context)
+
+    received = []
+
+    async def consume():
+        async for trade_signal in stream:
+            received.append(trade_signal)
+
+    task = asyncio.create_task(consume())
+    for _ in range(10):
+        if server._subscribers:
+            break
+        await asyncio.sleep(0)
+
+    await server.emit_signal(_make_signal("idem-4"))
+    context.close()
+    await asyncio.wait_for(task, timeout=0.5)
+
+    assert [trade_signal.signal_id for trade_signal in received] == ["idem-4"]
+    assert server._subscribers == []
@@ -347,7 +347,7 @@ async def test_process_candle_signals_startup_gate_uses_confirmed_candle(monkeyp
     engine = StrategyEngine("postgresql://localhost/varon_fi")
     strategy = RecordingStrategy()
     engine.strategies = {"s1": strategy}
-    engine._startup_latest_ts["BTC:5m"] = datetime(2026, 3, 9, 12, 0, tzinfo=timezone.utc)
+    engine._startup_latest_ts[("BTC", "5m")] = datetime(2026, 3, 9, 12, 0, tzinfo=timezone.utc)
 
     async def fake_fetch_history(*_args, **_kwargs):
         return pd.DataFrame(
@@ -419,3 +419,263 @@ async def test_initialize_positions_state_normalizes_naive_entry_ts():
     assert entry_ts.tzinfo is not None
     assert entry_ts.utcoffset() == timezone.utc.utcoffset(entry_ts)
     assert entry_deviation == 0.75
+
+
+@pytest.mark.asyncio
+async def test_history_for_candle_updates_restreamed_bar_in_place(monkeypatch):
+    engine = StrategyEngine("postgresql://localhost/varon_fi")
+    fetches = 0
+
+    async def fake_fetch_history(*_args, **_kwargs):
+        nonlocal fetches
+        fetches += 1
+        return pd.DataFrame(
+            [
+                {"timestamp": datetime(2026, 3, 9, 12, 0, tzinfo=timezone.utc), "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0},
+                {"timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc), "open": 2.0, "high": 2.0, "low": 2.0, "close": 2.0, "volume": 2.0},
+            ]
+        )
+
+    monkeypatch.setattr(engine, "_fetch_history", fake_fetch_history)
+
+    candle = {
+        "symbol": "BTC",
+        "timeframe": "5m",
+        "timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc),
+        "open": 2.0,
+        "high": 2.5,
+        "low": 1.5,
+        "close": 2.25,
+        "volume": 3.0,
+    }
+
+    first = await engine._history_for_candle("BTC", "5m", candle, bars=2)
+    assert fetches == 1
+    assert len(first) == 2
+
+    # The same bar streamed again (still forming) refreshes the cached row
+    # without another round trip.
+    candle["close"] = 9.0
+    second = await engine._history_for_candle("BTC", "5m", candle, bars=2)
+    assert fetches == 1
+    assert second["close"].iloc[-1] == 9.0
+    assert len(second) == 2
+
+
+@pytest.mark.asyncio
+async def test_history_for_candle_appends_next_bar_and_trims(monkeypatch):
+    engine = StrategyEngine("postgresql://localhost/varon_fi")
+    fetches = 0
+
+    async def fake_fetch_history(*_args, **_kwargs):
+        nonlocal fetches
+        fetches += 1
+        return pd.DataFrame(
+            [
+                {"timestamp": datetime(2026, 3, 9, 12, 0, tzinfo=timezone.utc), "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0},
+                {"timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc), "open": 2.0, "high": 2.0, "low": 2.0, "close": 2.0, "volume": 2.0},
+            ]
+        )
+
+    monkeypatch.setattr(engine, "_fetch_history", fake_fetch_history)
+
+    seed_candle = {
+        "symbol": "BTC",
+        "timeframe": "5m",
+        "timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc),
+        "open": 2.0,
+        "high": 2.0,
+        "low": 2.0,
+        "close": 2.0,
+        "volume": 2.0,
+    }
+    await engine._history_for_candle("BTC", "5m", seed_candle, bars=2)
+    assert fetches == 1
+
+    next_candle = dict(seed_candle)
+    next_candle["timestamp"] = datetime(2026, 3, 9, 12, 10, tzinfo=timezone.utc)
+    next_candle["close"] = 5.0
+
+    history = await engine._history_for_candle("BTC", "5m", next_candle, bars=2)
+
+    assert fetches == 1
+    assert len(history) == 2  # trimmed back to capacity
+    assert list(history["timestamp"]) == [
+        datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc),
+        datetime(2026, 3, 9, 12, 10, tzinfo=timezone.utc),
+    ]
+    assert history["close"].iloc[-1] == 5.0
+
+
+@pytest.mark.asyncio
+async def test_history_for_candle_reseeds_on_sequence_gap(monkeypatch):
+    engine = StrategyEngine("postgresql://localhost/varon_fi")
+    fetches = 0
+
+    async def fake_fetch_history(*_args, **_kwargs):
+        nonlocal fetches
+        fetches += 1
+        return pd.DataFrame(
+            [
+                {"timestamp": datetime(2026, 3, 9, 12, 0, tzinfo=timezone.utc), "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0},
+                {"timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc), "open": 2.0, "high": 2.0, "low": 2.0, "close": 2.0, "volume": 2.0},
+            ]
+        )
+
+    monkeypatch.setattr(engine, "_fetch_history", fake_fetch_history)
+
+    seed_candle = {
+        "symbol": "BTC",
+        "timeframe": "5m",
+        "timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc),
+        "open": 2.0,
+        "high": 2.0,
+        "low": 2.0,
+        "close": 2.0,
+        "volume": 2.0,
+    }
+    await engine._history_for_candle("BTC", "5m", seed_candle, bars=2)
+    assert fetches == 1
+
+    # Two steps ahead of the cached tail: the cache cannot bridge the gap,
+    # so the fetch is authoritative and reseeds it.
+    gap_candle = dict(seed_candle)
+    gap_candle["timestamp"] = datetime(2026, 3, 9, 12, 20, tzinfo=timezone.utc)
+
+    history = await engine._history_for_candle("BTC", "5m", gap_candle, bars=2)
+
+    assert fetches == 2
+    cached_capacity, cached = engine._history_cache[("BTC", "5m")]
+    assert cached_capacity == 2
+    assert cached is history
+
+
+class MutatingStrategy(DummyStrategy):
+    def __init__(self):
+        super().__init__("mutator", "long")
+
+    def on_candle(self, ohlc, history):
+        history["close"] = -1.0
+        return super().on_candle(ohlc, history)
+
+
+@pytest.mark.asyncio
+async def test_strategy_cannot_mutate_served_history_into_cache(monkeypatch):
+    engine = StrategyEngine("postgresql://localhost/varon_fi")
+    engine.strategies = {"s1": MutatingStrategy()}
+
+    async def fake_fetch_history(*_args, **_kwargs):
+        return pd.DataFrame(
+            [
+                {"timestamp": datetime(2026, 3, 9, 12, 0, tzinfo=timezone.utc), "open": 100, "high": 101, "low": 99, "close": 100.5, "volume": 10},
+                {"timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc), "open": 101, "high": 102, "low": 100, "close": 101.5, "volume": 12},
+            ]
+        )
+
+    async def fake_persist_signal(_signal):
+        return "id-s1"
+
+    monkeypatch.setattr(engine, "_fetch_history", fake_fetch_history)
+    monkeypatch.setattr(engine, "_persist_signal", fake_persist_signal)
+
+    incoming = {
+        "symbol": "BTC",
+        "timeframe": "5m",
+        "timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc),
+        "open": 999,
+        "high": 999,
+        "low": 999,
+        "close": 999,
+        "volume": 999,
+    }
+
+    signals = await engine.process_candle_signals(incoming)
+
+    assert len(signals) == 1
+    _capacity, cached = engine._history_cache[("BTC", "5m")]
+    assert list(cached["close"]) == [100.5, 101.5]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_index_tracks_strategies_reassignment(monkeypatch):
+    engine = StrategyEngine("postgresql://localhost/varon_fi")
+    engine.strategies = {"s1": DummyStrategy("alpha", "long")}
+
+    async def fake_fetch_history(*_args, **_kwargs):
+        return pd.DataFrame(
+            [
+                {"timestamp": datetime(2026, 3, 9, 12, 0, tzinfo=timezone.utc), "open": 1, "high": 1, "low": 1, "close": 1, "volume": 1},
+                {"timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc), "open": 2, "high": 2, "low": 2, "close": 2, "volume": 2},
+                {"timestamp": datetime(2026, 3, 9, 12, 10, tzinfo=timezone.utc), "open": 3, "high": 3, "low": 3, "close": 3, "volume": 3},
+            ]
+        )
+
+    async def fake_persist_signal(signal):
+        return f"id-{signal.strategy_id}"
+
+    monkeypatch.setattr(engine, "_fetch_history", fake_fetch_history)
+    monkeypatch.setattr(engine, "_persist_signal", fake_persist_signal)
+
+    candle = {
+        "symbol": "BTC",
+        "timeframe": "5m",
+        "timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc),
+        "open": 2.0,
+        "high": 2.0,
+        "low": 2.0,
+        "close": 2.0,
+        "volume": 2.0,
+    }
+
+    first = await engine.process_candle_signals(candle)
+    assert {s.strategy_id for s in first} == {"s1"}
+
+    # Tests and reloads swap the dict wholesale; the dispatch index must
+    # notice and rebuild rather than serve the stale mapping.
+    engine.strategies = {
+        "s1": DummyStrategy("alpha", "long"),
+        "s2": DummyStrategy("beta", "short"),
+    }
+
+    later = dict(candle)
+    later["timestamp"] = datetime(2026, 3, 9, 12, 10, tzinfo=timezone.utc)
+    second = await engine.process_candle_signals(later)
+
+    assert {s.strategy_id for s in second} == {"s1", "s2"}
+
+
+@pytest.mark.asyncio
+async def test_process_candle_skips_fetch_while_all_strategies_warming(monkeypatch):
+    engine = StrategyEngine("postgresql://localhost/varon_fi")
+    engine.strategies = {"s1": DummyStrategy("alpha", "long")}
+    warmup_key = ("s1", "BTC", "5m")
+    engine._warmup_required[warmup_key] = 50
+    engine._warmup_complete[warmup_key] = False
+
+    fetches = 0
+
+    async def fake_fetch_history(*_args, **_kwargs):
+        nonlocal fetches
+        fetches += 1
+        return pd.DataFrame()
+
+    monkeypatch.setattr(engine, "_fetch_history", fake_fetch_history)
+
+    candle = {
+        "symbol": "BTC",
+        "timeframe": "5m",
+        "timestamp": datetime(2026, 3, 9, 12, 5, tzinfo=timezone.utc),
+        "open": 2.0,
+        "high": 2.0,
+        "low": 2.0,
+        "close": 2.0,
+        "volume": 2.0,
+    }
+
+    signals = await engine.process_candle_signals(candle)
+
+    assert signals == []
+    assert fetches == 0
+    metrics = engine.get_metrics_snapshot()
+    assert metrics["candles_processed"] == 1
+    assert metrics["strategies_evaluated"] == 1